@@ -173,3 +173,4 @@ def reset_backends():
     global _tts_backend, _stt_backend
     _tts_backend = None
     _stt_backend = None
+    get_backend_type.cache_clear()
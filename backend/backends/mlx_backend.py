@@ -4,12 +4,13 @@ MLX backend implementation for TTS and STT using mlx-audio.
 
 from typing import Optional, List, Tuple
 import asyncio
+import inspect
 import numpy as np
 from pathlib import Path
 
 from . import TTSBackend, STTBackend
 from ..utils.cache import get_cache_key, get_cached_voice_prompt, cache_voice_prompt
-from ..utils.audio import normalize_audio, load_audio
+from ..utils.audio import normalize_audio_inplace, load_audio
 from ..utils.progress import get_progress_manager
 from ..utils.hf_progress import HFProgressTracker, create_hf_progress_callback
 from ..utils.tasks import get_task_manager
@@ -18,6 +19,13 @@ from ..utils.tasks import get_task_manager
 class MLXTTSBackend:
     """MLX-based TTS backend using mlx-audio."""
     
+    # MLX model mapping
+    MLX_MODEL_MAP = {
+        "1.7B": "mlx-community/Qwen3-TTS-12Hz-1.7B-Base-bf16",
+        # 0.6B not yet converted to MLX format
+        "0.6B": "mlx-community/Qwen3-TTS-12Hz-1.7B-Base-bf16",  # Fallback to 1.7B
+    }
+    
     def __init__(self, model_size: str = "1.7B"):
         self.model = None
         self.model_size = model_size
@@ -37,17 +45,10 @@ class MLXTTSBackend:
         Returns:
             HuggingFace Hub model ID for MLX
         """
-        # MLX model mapping
-        mlx_model_map = {
-            "1.7B": "mlx-community/Qwen3-TTS-12Hz-1.7B-Base-bf16",
-            # 0.6B not yet converted to MLX format
-            "0.6B": "mlx-community/Qwen3-TTS-12Hz-1.7B-Base-bf16",  # Fallback to 1.7B
-        }
-        
-        if model_size not in mlx_model_map:
+        if model_size not in self.MLX_MODEL_MAP:
             raise ValueError(f"Unknown model size: {model_size}")
         
-        hf_model_id = mlx_model_map[model_size]
+        hf_model_id = self.MLX_MODEL_MAP[model_size]
         print(f"Will download MLX model from HuggingFace Hub: {hf_model_id}")
         
         return hf_model_id
@@ -270,16 +271,20 @@ class MLXTTSBackend:
         Returns:
             Tuple of (combined_audio, combined_text)
         """
-        combined_audio = []
-        
-        for audio_path in audio_paths:
+        def _load_sample_sync(audio_path: str) -> np.ndarray:
             audio, sr = load_audio(audio_path)
-            audio = normalize_audio(audio)
-            combined_audio.append(audio)
+            # load_audio returns a fresh float32 array, so normalize it in place
+            return normalize_audio_inplace(audio.astype(np.float32, copy=False))
+        
+        # Decode the samples concurrently; each file is independent
+        combined_audio = await asyncio.gather(
+            *[asyncio.to_thread(_load_sample_sync, audio_path) for audio_path in audio_paths]
+        )
         
-        # Concatenate audio
+        # Concatenate into one buffer and normalize it in place
         mixed = np.concatenate(combined_audio)
-        mixed = normalize_audio(mixed)
+        del combined_audio
+        mixed = normalize_audio_inplace(mixed)
         
         # Combine texts
         combined_text = " ".join(reference_texts)
@@ -340,7 +345,6 @@ class MLXTTSBackend:
                 # Try with voice cloning parameters if supported
                 if ref_audio:
                     # Check if generate accepts ref_audio parameter
-                    import inspect
                     sig = inspect.signature(self.model.generate)
                     if "ref_audio" in sig.parameters:
                         # Generate with voice cloning
@@ -4,21 +4,30 @@ PyTorch backend implementation for TTS and STT.
 
 from typing import Optional, List, Tuple
 import asyncio
+import logging
 import torch
 import numpy as np
 from pathlib import Path
 
 from . import TTSBackend, STTBackend
 from ..utils.cache import get_cache_key, get_cached_voice_prompt, cache_voice_prompt
-from ..utils.audio import normalize_audio, load_audio
+from ..utils.audio import normalize_audio_inplace, load_audio
 from ..utils.progress import get_progress_manager
 from ..utils.hf_progress import HFProgressTracker, create_hf_progress_callback
 from ..utils.tasks import get_task_manager
 
+logger = logging.getLogger(__name__)
+
 
 class PyTorchTTSBackend:
     """PyTorch-based TTS backend using Qwen3-TTS."""
     
+    # HuggingFace Hub model IDs by model size
+    HF_MODEL_MAP = {
+        "1.7B": "Qwen/Qwen3-TTS-12Hz-1.7B-Base",
+        "0.6B": "Qwen/Qwen3-TTS-12Hz-0.6B-Base",
+    }
+    
     def __init__(self, model_size: str = "1.7B"):
         self.model = None
         self.model_size = model_size
@@ -48,15 +57,10 @@ class PyTorchTTSBackend:
         Returns:
             HuggingFace Hub model ID
         """
-        hf_model_map = {
-            "1.7B": "Qwen/Qwen3-TTS-12Hz-1.7B-Base",
-            "0.6B": "Qwen/Qwen3-TTS-12Hz-0.6B-Base",
-        }
-        
-        if model_size not in hf_model_map:
+        if model_size not in self.HF_MODEL_MAP:
             raise ValueError(f"Unknown model size: {model_size}")
         
-        return hf_model_map[model_size]
+        return self.HF_MODEL_MAP[model_size]
     
     def _is_model_cached(self, model_size: str) -> bool:
         """
@@ -283,16 +287,20 @@ class PyTorchTTSBackend:
         Returns:
             Tuple of (combined_audio, combined_text)
         """
-        combined_audio = []
-        
-        for audio_path in audio_paths:
+        def _load_sample_sync(audio_path: str) -> np.ndarray:
             audio, sr = load_audio(audio_path)
-            audio = normalize_audio(audio)
-            combined_audio.append(audio)
+            # load_audio returns a fresh float32 array, so normalize it in place
+            return normalize_audio_inplace(audio.astype(np.float32, copy=False))
+        
+        # Decode the samples concurrently; each file is independent
+        combined_audio = await asyncio.gather(
+            *[asyncio.to_thread(_load_sample_sync, audio_path) for audio_path in audio_paths]
+        )
         
-        # Concatenate audio
+        # Concatenate into one buffer and normalize it in place
         mixed = np.concatenate(combined_audio)
-        mixed = normalize_audio(mixed)
+        del combined_audio
+        mixed = normalize_audio_inplace(mixed)
         
         # Combine texts
         combined_text = " ".join(reference_texts)
@@ -414,26 +422,29 @@ class PyTorchSTTBackend:
         Args:
             model_size: Model size (tiny, base, small, medium, large)
         """
-        print(f"[DEBUG] load_model_async called with size: {model_size}")
+        logger.debug("load_model_async called with size: %s", model_size)
         if model_size is None:
             model_size = self.model_size
 
-        print(f"[DEBUG] Model already loaded? {self.model is not None}, current size: {self.model_size}, requested: {model_size}")
+        logger.debug(
+            "Model already loaded? %s, current size: %s, requested: %s",
+            self.model is not None, self.model_size, model_size,
+        )
         if self.model is not None and self.model_size == model_size:
-            print(f"[DEBUG] Early return - model already loaded")
+            logger.debug("Early return - model already loaded")
             return
 
-        print(f"[DEBUG] Calling asyncio.to_thread for _load_model_sync")
+        logger.debug("Calling asyncio.to_thread for _load_model_sync")
         # Run blocking load in thread pool
         await asyncio.to_thread(self._load_model_sync, model_size)
-        print(f"[DEBUG] asyncio.to_thread completed")
+        logger.debug("asyncio.to_thread completed")
     
     # Alias for compatibility
     load_model = load_model_async
     
     def _load_model_sync(self, model_size: str):
         """Synchronous model loading."""
-        print(f"[DEBUG] _load_model_sync called for Whisper {model_size}")
+        logger.debug("_load_model_sync called for Whisper %s", model_size)
         try:
             progress_manager = get_progress_manager()
             task_manager = get_task_manager()
@@ -449,16 +460,16 @@ class PyTorchSTTBackend:
             tracker = HFProgressTracker(progress_callback, filter_non_downloads=is_cached)
 
             # Patch tqdm BEFORE importing transformers
-            print("[DEBUG] Starting tqdm patch BEFORE transformers import")
+            logger.debug("Starting tqdm patch BEFORE transformers import")
             tracker_context = tracker.patch_download()
             tracker_context.__enter__()
-            print("[DEBUG] tqdm patched, now importing transformers")
+            logger.debug("tqdm patched, now importing transformers")
 
             # Import transformers
             from transformers import WhisperProcessor, WhisperForConditionalGeneration
 
             model_name = f"openai/whisper-{model_size}"
-            print(f"[DEBUG] Model name: {model_name}")
+            logger.debug("Model name: %s", model_name)
 
             print(f"Loading Whisper model {model_size} on {self.device}...")
 
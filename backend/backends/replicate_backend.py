@@ -3,19 +3,272 @@ Replicate backend for TTS - uses Replicate's GPU infrastructure.
 """
 
 import os
+import asyncio
+import logging
 import base64
 import httpx
 import numpy as np
-from typing import Optional, Tuple, List
-import tempfile
+from typing import Optional, Tuple, List, Union
 import soundfile as sf
+import soxr
 import io
+import hashlib
+import random
+import struct
+import time
+from collections import OrderedDict
 
 try:
     import replicate
 except ImportError:
     replicate = None
 
+# pybase64 is a drop-in for the stdlib codec backed by libbase64's SIMD kernels
+try:
+    import pybase64
+except ImportError:
+    pybase64 = base64
+
+logger = logging.getLogger(__name__)
+
+# MIME types for reference audio by file extension (WAV when unknown)
+_AUDIO_MIME_TYPES = {
+    ".wav": "audio/wav",
+    ".mp3": "audio/mpeg",
+    ".flac": "audio/flac",
+    ".ogg": "audio/ogg",
+    ".m4a": "audio/mp4",
+}
+_AUDIO_EXTENSIONS = {mime: ext for ext, mime in _AUDIO_MIME_TYPES.items()}
+
+# xxh3 is far faster than cryptographic hashes; the upload cache only needs
+# practically unique keys, not resistance to deliberate collisions
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+
+def _content_key(data) -> str:
+    """Fast content hash used to key the uploaded audio cache."""
+    if xxhash is not None:
+        return xxhash.xxh3_128_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+# Replicate file URLs for uploaded reference audio, keyed by content hash.
+# Entries expire well before Replicate deletes the uploaded file.
+_UPLOADED_AUDIO_CACHE_SIZE = 32
+_UPLOADED_AUDIO_TTL = 60 * 60  # seconds
+_uploaded_audio_cache: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+
+
+def _reference_filename(mime_type: str) -> str:
+    """File name to upload reference audio under, so Replicate sees its format."""
+    return "reference" + _AUDIO_EXTENSIONS.get(mime_type, ".wav")
+
+
+def _read_file(path: str) -> bytes:
+    """Read a whole file (run via asyncio.to_thread)."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+# Replicate API client shared by the TTS and STT backends, so both reuse one
+# connection pool to the Replicate API
+_replicate_client = None
+
+
+def _get_replicate_client():
+    """Get or create the shared Replicate client."""
+    global _replicate_client
+
+    if _replicate_client is None:
+        if replicate is None:
+            raise ImportError("replicate package not installed. Run: pip install replicate")
+
+        api_token = os.environ.get("REPLICATE_API_TOKEN") or os.environ.get("REPLICATE_API_KEY")
+        if not api_token:
+            raise ValueError("REPLICATE_API_TOKEN or REPLICATE_API_KEY environment variable not set")
+
+        _replicate_client = replicate.Client(api_token=api_token)
+
+    return _replicate_client
+
+
+# Shared client for downloading Replicate outputs, so connections to the
+# delivery CDN are kept alive between generations
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP client (HTTP/2 when h2 is installed)."""
+    global _http_client
+
+    if _http_client is None or _http_client.is_closed:
+        try:
+            import h2  # noqa: F401
+            http2 = True
+        except ImportError:
+            http2 = False
+
+        # No custom transport: it would stop httpx honouring HTTP(S)_PROXY.
+        # Retries are handled in _fetch_audio.
+        _http_client = httpx.AsyncClient(
+            http2=http2,
+            timeout=httpx.Timeout(60.0),
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+        )
+
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client (called on application shutdown)."""
+    global _http_client
+
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+async def _fetch_audio(url: str, attempts: int = 3) -> bytearray:
+    """
+    Download audio, retrying transient network errors with jittered backoff.
+
+    Covers both failed connection attempts and errors once a download is
+    under way; this is the only retry layer for output downloads.
+    """
+    for attempt in range(attempts):
+        try:
+            return await _fetch_audio_once(url)
+        except httpx.TransportError:
+            if attempt == attempts - 1:
+                raise
+            await asyncio.sleep(0.1 * 2 ** attempt + random.random() * 0.1)
+
+
+async def _fetch_audio_once(url: str) -> bytearray:
+    """
+    Download audio into a single buffer as it streams in.
+
+    The buffer is sized from Content-Length up front when the server sends
+    it, so chunks are copied once instead of being collected and joined.
+    """
+    async with _get_http_client().stream("GET", url) as response:
+        response.raise_for_status()
+
+        buffer = bytearray(int(response.headers.get("content-length") or 0))
+        size = 0
+        async for chunk in response.aiter_bytes():
+            end = size + len(chunk)
+            # Slice assignment grows the buffer if the length was wrong
+            buffer[size:end] = chunk
+            size = end
+        del buffer[size:]
+
+    return buffer
+
+
+def _read_mono(path: str) -> np.ndarray:
+    """Read an audio file as a mono float32 array."""
+    audio, _ = sf.read(path, dtype="float32", always_2d=False)
+    if audio.ndim == 2:
+        channels = audio.shape[1]
+        audio = audio.sum(axis=1, dtype=np.float32)
+        audio *= np.float32(1.0 / channels)
+    return audio
+
+
+def _read_mono_into(path: str, out: np.ndarray) -> int:
+    """
+    Decode an audio file as mono float32 directly into out.
+
+    Returns:
+        Number of frames written
+    """
+    with sf.SoundFile(path) as f:
+        if f.channels == 1:
+            return len(f.read(out=out))
+
+        audio = f.read(frames=len(out), dtype="float32", always_2d=True)
+        frames = len(audio)
+        np.sum(audio, axis=1, dtype=np.float32, out=out[:frames])
+        out[:frames] *= np.float32(1.0 / f.channels)
+        return frames
+
+
+def _decode_wav_pcm16(audio_bytes: Union[bytes, bytearray]) -> Optional[Tuple[np.ndarray, int]]:
+    """
+    Decode a 16-bit PCM WAV to mono float32 without going through soundfile.
+
+    Samples are viewed in place with np.frombuffer and converted in a single
+    vectorized pass.
+
+    Returns:
+        Tuple of (audio_array, sample_rate), or None if the data is not a
+        plain PCM16 WAV
+    """
+    if len(audio_bytes) < 12 or audio_bytes[:4] != b"RIFF" or audio_bytes[8:12] != b"WAVE":
+        return None
+
+    fmt = None
+    pos = 12
+    while pos + 8 <= len(audio_bytes):
+        chunk_id = bytes(audio_bytes[pos:pos + 4])
+        (chunk_size,) = struct.unpack_from("<I", audio_bytes, pos + 4)
+        body = pos + 8
+
+        if chunk_id == b"fmt ":
+            # A truncated fmt chunk is left for soundfile to reject
+            if chunk_size < 16 or body + chunk_size > len(audio_bytes):
+                return None
+            audio_format, channels, sample_rate = struct.unpack_from("<HHI", audio_bytes, body)
+            (bits_per_sample,) = struct.unpack_from("<H", audio_bytes, body + 14)
+            fmt = (audio_format, channels, sample_rate, bits_per_sample)
+        elif chunk_id == b"data":
+            if fmt is None:
+                return None
+            audio_format, channels, sample_rate, bits_per_sample = fmt
+            if audio_format != 1 or bits_per_sample != 16 or channels == 0:
+                return None
+
+            # Streamed WAVs may carry a placeholder size, so clamp to the data we have
+            end = min(body + chunk_size, len(audio_bytes))
+            frames = (end - body) // (2 * channels)
+            pcm = np.frombuffer(audio_bytes, dtype="<i2", count=frames * channels, offset=body)
+
+            if channels == 1:
+                audio_array = pcm.astype(np.float32)
+                audio_array *= np.float32(1.0 / 32768.0)
+            else:
+                audio_array = pcm.reshape(frames, channels).sum(axis=1, dtype=np.float32)
+                audio_array *= np.float32(1.0 / (32768.0 * channels))
+            return audio_array, sample_rate
+
+        # Chunks are word-aligned
+        pos = body + chunk_size + (chunk_size & 1)
+
+    return None
+
+
+def _decode_audio(audio_bytes: Union[bytes, bytearray]) -> Tuple[np.ndarray, int]:
+    """Decode downloaded audio to a mono float32 array."""
+    # Fast path for the common PCM16 WAV output; soundfile handles the rest
+    decoded = _decode_wav_pcm16(audio_bytes)
+    if decoded is not None:
+        return decoded
+
+    audio_array, sample_rate = sf.read(io.BytesIO(audio_bytes), dtype="float32", always_2d=False)
+
+    if audio_array.ndim == 2:
+        # Downmix in one float32 pass, without a float64 intermediate
+        channels = audio_array.shape[1]
+        audio_array = audio_array.sum(axis=1, dtype=np.float32)
+        audio_array *= np.float32(1.0 / channels)
+
+    return audio_array, sample_rate
+
 
 class ReplicateTTSBackend:
     """TTS backend using Replicate's hosted Qwen3-TTS model."""
@@ -31,14 +284,7 @@ class ReplicateTTSBackend:
         Initialize Replicate client.
         Model runs on Replicate's GPUs, no local loading needed.
         """
-        if replicate is None:
-            raise ImportError("replicate package not installed. Run: pip install replicate")
-
-        api_token = os.environ.get("REPLICATE_API_TOKEN") or os.environ.get("REPLICATE_API_KEY")
-        if not api_token:
-            raise ValueError("REPLICATE_API_TOKEN or REPLICATE_API_KEY environment variable not set")
-
-        self._client = replicate.Client(api_token=api_token)
+        self._client = _get_replicate_client()
         self._loaded = True
 
     # Alias for compatibility
@@ -52,24 +298,16 @@ class ReplicateTTSBackend:
     ) -> Tuple[dict, bool]:
         """
         Create voice prompt from reference audio.
-        For Replicate, we store the audio as base64 to send with requests.
+        For Replicate, we keep the raw audio bytes; generate uploads them once
+        to Replicate's file API and reuses the URL (no base64 inflation).
         """
-        with open(audio_path, "rb") as f:
-            audio_bytes = f.read()
-
-        audio_base64 = base64.b64encode(audio_bytes).decode("utf-8")
+        audio_bytes = await asyncio.to_thread(_read_file, audio_path)
 
         ext = os.path.splitext(audio_path)[1].lower()
-        mime_type = {
-            ".wav": "audio/wav",
-            ".mp3": "audio/mpeg",
-            ".flac": "audio/flac",
-            ".ogg": "audio/ogg",
-            ".m4a": "audio/mp4",
-        }.get(ext, "audio/wav")
+        mime_type = _AUDIO_MIME_TYPES.get(ext, "audio/wav")
 
         voice_prompt = {
-            "audio_base64": audio_base64,
+            "audio_bytes": audio_bytes,
             "audio_mime_type": mime_type,
             "reference_text": reference_text,
             "backend": "replicate",
@@ -83,20 +321,37 @@ class ReplicateTTSBackend:
         reference_texts: List[str],
     ) -> Tuple[np.ndarray, str]:
         """Combine multiple voice prompts by concatenating audio."""
-        import librosa
-
-        combined_audio = []
-        sample_rate = None
-
-        for path in audio_paths:
-            audio, sr = librosa.load(path, sr=None)
-            if sample_rate is None:
-                sample_rate = sr
-            elif sr != sample_rate:
-                audio = librosa.resample(audio, orig_sr=sr, target_sr=sample_rate)
-            combined_audio.append(audio)
+        def load_resampled(path: str, source_rate: int, target_rate: int) -> np.ndarray:
+            return soxr.resample(_read_mono(path), source_rate, target_rate, quality="HQ")
+
+        # Header-only pass to size the output buffer
+        infos = await asyncio.gather(*[asyncio.to_thread(sf.info, path) for path in audio_paths])
+        sample_rate = infos[0].samplerate
+
+        # Clips at a different rate are resampled up front so their length is known
+        mismatched = [i for i, info in enumerate(infos) if info.samplerate != sample_rate]
+        resampled = dict(zip(mismatched, await asyncio.gather(*[
+            asyncio.to_thread(load_resampled, audio_paths[i], infos[i].samplerate, sample_rate)
+            for i in mismatched
+        ])))
+        lengths = [len(resampled[i]) if i in resampled else info.frames for i, info in enumerate(infos)]
+
+        # Decode every clip concurrently, each directly into its own slice of the output
+        combined = np.empty(sum(lengths), dtype=np.float32)
+        offsets = np.cumsum([0] + lengths[:-1]).tolist()
+        slices = [combined[offset:offset + length] for offset, length in zip(offsets, lengths)]
+
+        def fill(i: int) -> int:
+            if i in resampled:
+                slices[i][:] = resampled[i]
+                return lengths[i]
+            return _read_mono_into(audio_paths[i], slices[i])
+
+        written = await asyncio.gather(*[asyncio.to_thread(fill, i) for i in range(len(audio_paths))])
+        if list(written) != lengths:
+            # A header overstated its frame count; close the gaps
+            combined = np.concatenate([s[:n] for s, n in zip(slices, written)])
 
-        combined = np.concatenate(combined_audio)
         combined_text = " ".join(reference_texts)
 
         return combined, combined_text
@@ -113,27 +368,29 @@ class ReplicateTTSBackend:
         if not self._loaded:
             await self.load_model_async()
 
-        # Validate voice_prompt has required audio data
-        if not voice_prompt.get("audio_base64"):
-            raise ValueError("No audio_base64 in voice_prompt - ensure profile has audio samples")
+        # Raw bytes from create_voice_prompt; base64 from stored profile samples
+        audio_bytes = voice_prompt.get("audio_bytes")
+        if not audio_bytes:
+            if not voice_prompt.get("audio_base64"):
+                raise ValueError("No audio in voice_prompt - ensure profile has audio samples")
+            audio_bytes = await asyncio.to_thread(pybase64.b64decode, voice_prompt["audio_base64"])
 
-        # Decode audio from base64 and save to temp file
-        audio_base64 = voice_prompt['audio_base64']
-        audio_bytes = base64.b64decode(audio_base64)
+        mime_type = voice_prompt.get("audio_mime_type", "audio/wav")
 
-        # Save to temp file and pass file handle to Replicate
-        temp_file = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-        temp_file.write(audio_bytes)
-        temp_file.flush()
-        temp_path = temp_file.name
-        temp_file.close()
+        # Upload once (cached by content); otherwise the SDK sends the bytes
+        ref_audio_url = await self._upload_ref_audio(audio_bytes, mime_type)
 
-        ref_audio_file = open(temp_path, "rb")
+        if ref_audio_url:
+            reference_audio = ref_audio_url
+        else:
+            # The SDK derives the upload's file name and type from .name
+            reference_audio = io.BytesIO(audio_bytes)
+            reference_audio.name = _reference_filename(mime_type)
 
         input_data = {
             "text": text,
             "mode": "voice_clone",
-            "reference_audio": ref_audio_file,
+            "reference_audio": reference_audio,
         }
 
         if voice_prompt.get("reference_text"):
@@ -142,20 +399,55 @@ class ReplicateTTSBackend:
         if seed is not None:
             input_data["seed"] = seed
 
-        try:
-            output = await self._run_replicate(input_data)
-            audio_array, sample_rate = await self._download_audio(output)
-        finally:
-            # Clean up temp file
-            ref_audio_file.close()
-            os.unlink(temp_path)
+        output = await self._run_replicate(input_data)
+        audio_array, sample_rate = await self._download_audio(output)
 
         return audio_array, sample_rate
 
+    async def _upload_ref_audio(self, audio_bytes: bytes, mime_type: str) -> Optional[str]:
+        """
+        Upload reference audio to Replicate's file API.
+
+        Uploads are cached by content for a limited time, so repeated
+        generations with the same voice send a short URL instead of the
+        whole recording.
+
+        Returns:
+            Download URL, or None if the upload is unavailable
+        """
+        files = getattr(self._client, "files", None)
+        if files is None:
+            # Older SDKs have no file API
+            return None
+
+        key = _content_key(audio_bytes)
+        now = time.monotonic()
+
+        cached = _uploaded_audio_cache.get(key)
+        if cached is not None and cached[1] > now:
+            _uploaded_audio_cache.move_to_end(key)
+            return cached[0]
+
+        try:
+            uploaded = await asyncio.to_thread(
+                files.create,
+                io.BytesIO(audio_bytes),
+                filename=_reference_filename(mime_type),
+                content_type=mime_type,
+            )
+            url = uploaded.urls["get"]
+        except Exception as e:
+            # Fall back to sending the audio with the prediction
+            logger.debug("Reference audio upload failed, sending inline: %s", e)
+            return None
+
+        _uploaded_audio_cache[key] = (url, now + _UPLOADED_AUDIO_TTL)
+        if len(_uploaded_audio_cache) > _UPLOADED_AUDIO_CACHE_SIZE:
+            _uploaded_audio_cache.popitem(last=False)
+        return url
+
     async def _run_replicate(self, input_data: dict):
         """Run the model on Replicate."""
-        import asyncio
-
         loop = asyncio.get_event_loop()
 
         def run_sync():
@@ -171,10 +463,7 @@ class ReplicateTTSBackend:
             audio_bytes = output
         elif isinstance(output, str):
             # It's a URL, download it
-            async with httpx.AsyncClient() as client:
-                response = await client.get(output, timeout=60.0)
-                response.raise_for_status()
-                audio_bytes = response.content
+            audio_bytes = await _fetch_audio(output)
         elif hasattr(output, '__iter__'):
             # Could be an iterator/generator yielding chunks or items
             items = list(output)
@@ -187,21 +476,13 @@ class ReplicateTTSBackend:
                 audio_bytes = b''.join(items)
             elif isinstance(first_item, str):
                 # It's a URL
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(first_item, timeout=60.0)
-                    response.raise_for_status()
-                    audio_bytes = response.content
+                audio_bytes = await _fetch_audio(first_item)
             else:
                 raise ValueError(f"Unexpected output type from Replicate: {type(first_item)}")
         else:
             raise ValueError(f"Unexpected output type from Replicate: {type(output)}")
 
-        audio_array, sample_rate = sf.read(io.BytesIO(audio_bytes))
-
-        if len(audio_array.shape) > 1:
-            audio_array = audio_array.mean(axis=1)
-
-        return audio_array.astype(np.float32), sample_rate
+        return await asyncio.to_thread(_decode_audio, audio_bytes)
 
     def unload_model(self) -> None:
         """No local model to unload."""
@@ -220,10 +501,18 @@ class ReplicateTTSBackend:
 class ReplicateSTTBackend:
     """STT backend using Replicate's Whisper."""
 
+    MODEL_ID = "openai/whisper:4d50797290df275329f202e48c76360b3f22b08d28c196cbc54600319435f8d2"
+
     def __init__(self):
         self._loaded = False
+        self._client = None
 
     async def load_model_async(self, model_size: str = "base") -> None:
+        """
+        Initialize Replicate client.
+        Uses the process-wide client shared with the TTS backend.
+        """
+        self._client = _get_replicate_client()
         self._loaded = True
 
     # Alias for compatibility
@@ -235,26 +524,22 @@ class ReplicateSTTBackend:
         language: Optional[str] = None,
     ) -> str:
         """Transcribe audio using Replicate's Whisper."""
-        if replicate is None:
-            raise ImportError("replicate package not installed")
-
-        api_token = os.environ.get("REPLICATE_API_TOKEN") or os.environ.get("REPLICATE_API_KEY")
-        if not api_token:
-            raise ValueError("REPLICATE_API_TOKEN or REPLICATE_API_KEY not set")
-
-        with open(audio_path, "rb") as f:
-            audio_bytes = f.read()
-
-        audio_base64 = base64.b64encode(audio_bytes).decode("utf-8")
+        if not self._loaded:
+            await self.load_model_async()
 
-        client = replicate.Client(api_token=api_token)
-        output = client.run(
-            "openai/whisper:4d50797290df275329f202e48c76360b3f22b08d28c196cbc54600319435f8d2",
-            input={
-                "audio": f"data:audio/wav;base64,{audio_base64}",
-                "language": language or "en",
-            }
-        )
+        def run_sync():
+            # Hand the SDK the open file so it can upload the raw audio
+            # instead of us inlining it as a base64 data: URI
+            with open(audio_path, "rb") as audio_file:
+                return self._client.run(
+                    self.MODEL_ID,
+                    input={
+                        "audio": audio_file,
+                        "language": language or "en",
+                    },
+                )
+
+        output = await asyncio.to_thread(run_sync)
 
         if isinstance(output, dict):
             return output.get("transcription", "")
@@ -262,6 +547,28 @@ class ReplicateSTTBackend:
 
     def unload_model(self) -> None:
         self._loaded = False
+        self._client = None
 
     def is_loaded(self) -> bool:
         return self._loaded
+
+
+async def warm_up_connections(timeout: float = 5.0) -> None:
+    """
+    Open the pooled connection to the Replicate API ahead of the first request.
+
+    Issues one cheap model lookup so DNS, TCP and TLS setup are not paid by
+    the first user-visible generation. Failures are ignored; the first real
+    request simply connects as it would have anyway.
+
+    The timeout only bounds how long this coroutine waits: the lookup runs in
+    a worker thread, which keeps going until the SDK call itself returns.
+    """
+    try:
+        client = _get_replicate_client()
+        await asyncio.wait_for(
+            asyncio.to_thread(client.models.get, ReplicateTTSBackend.MODEL_ID),
+            timeout=timeout,
+        )
+    except Exception:
+        pass
@@ -17,10 +17,16 @@ def build_server():
     """Build Python server as standalone binary."""
     backend_dir = Path(__file__).parent
 
+    # The Tauri sidecar needs a single executable, so --onefile is the default.
+    # Set VOICEBOX_ONEDIR=1 for local/CI builds that don't ship the sidecar:
+    # --onedir skips packing everything into the self-extracting archive at
+    # the end of the build, and the result starts without unpacking to a temp dir.
+    onedir = os.getenv('VOICEBOX_ONEDIR') == '1'
+
     # PyInstaller arguments
     args = [
         'server.py',  # Use server.py as entry point instead of main.py
-        '--onefile',
+        '--onedir' if onedir else '--onefile',
         '--name', 'voicebox-server',
     ]
 
@@ -70,6 +76,30 @@ def build_server():
         '--collect-submodules', 'jaraco',
     ])
 
+    # Leave out packages that the inference server never imports but that
+    # get pulled in through optional imports in torch/transformers/librosa.
+    # torch.distributed, torch.fx, torch.onnx, sympy and scipy stay bundled:
+    # torch and librosa import them at load time.
+    args.extend([
+        '--exclude-module', 'tkinter',
+        '--exclude-module', 'matplotlib',
+        '--exclude-module', 'IPython',
+        '--exclude-module', 'notebook',
+        '--exclude-module', 'pandas',
+        '--exclude-module', 'tensorboard',
+        '--exclude-module', 'torch.utils.tensorboard',
+        '--exclude-module', 'torch.testing._internal',
+    ])
+
+    # uvicorn picks its event loop via a dynamic import, so bundle uvloop
+    # explicitly (not available on Windows)
+    if platform.system() != "Windows":
+        args.extend([
+            '--hidden-import', 'uvicorn.loops.auto',
+            '--hidden-import', 'uvicorn.loops.uvloop',
+            '--hidden-import', 'uvloop',
+        ])
+
     # Add MLX-specific imports if building on Apple Silicon
     if is_apple_silicon():
         print("Building for Apple Silicon - including MLX dependencies")
@@ -90,6 +120,29 @@ def build_server():
     else:
         print("Building for non-Apple Silicon platform - PyTorch only")
 
+    # Set VOICEBOX_STRIP=1 to strip symbol tables from bundled shared libraries.
+    # Opt-in until a stripped torch bundle has been verified: GNU strip can
+    # corrupt patchelf-repaired manylinux libraries. Linux only - stripping
+    # breaks code signatures on macOS and is not supported on Windows.
+    if os.getenv('VOICEBOX_STRIP') == '1' and platform.system() == "Linux":
+        args.append('--strip')
+
+    # PyInstaller uses UPX when it finds it; UPX_DIR points it at a specific
+    # install. CUDA and torch libraries must never be UPX-packed - the packed
+    # copies fail to load in the driver.
+    upx_dir = os.getenv('UPX_DIR')
+    if upx_dir:
+        args.extend(['--upx-dir', upx_dir])
+    for pattern in [
+        'libcudart*', 'libcudnn*', 'libcublas*', 'libcufft*', 'libcurand*',
+        'libcusparse*', 'libcusolver*', 'libnccl*', 'libnvrtc*', 'libnvJitLink*',
+        'libcupti*', 'libnvToolsExt*', 'libtorch*', 'libc10*',
+        'cudart*.dll', 'cudnn*.dll', 'cublas*.dll', 'cufft*.dll', 'curand*.dll',
+        'cusparse*.dll', 'cusolver*.dll', 'nvrtc*.dll', 'nvJitLink*.dll',
+        'cupti*.dll', 'nvToolsExt*.dll', 'torch*.dll', 'c10*.dll',
+    ]:
+        args.extend(['--upx-exclude', pattern])
+
     args.extend([
         '--noconfirm',
         '--clean',
@@ -101,7 +154,10 @@ def build_server():
     # Run PyInstaller
     PyInstaller.__main__.run(args)
     
-    print(f"Binary built in {backend_dir / 'dist' / 'voicebox-server'}")
+    if onedir:
+        print(f"Server built in {backend_dir / 'dist' / 'voicebox-server'} (onedir)")
+    else:
+        print(f"Binary built in {backend_dir / 'dist' / 'voicebox-server'}")
 
 
 if __name__ == '__main__':
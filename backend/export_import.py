@@ -5,13 +5,22 @@ Handles exporting profiles to ZIP archives and importing them back.
 Also handles exporting individual generations.
 """
 
+import asyncio
 import json
 import zipfile
 import io
+import shutil
+import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import Optional, BinaryIO, Dict, Union
 from sqlalchemy.orm import Session
 
+# orjson is optional - falls back to the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Support both package imports (local dev) and direct imports (cloud deployment)
 try:
     from .models import VoiceProfileResponse, VoiceProfileCreate
@@ -25,6 +34,26 @@ except ImportError:
     import config
 
 
+# Buffer size for streaming archive members to disk
+EXTRACT_CHUNK_SIZE = 64 * 1024
+# Maximum number of samples extracted in parallel during import
+EXTRACT_CONCURRENCY = 4
+
+
+def _dump_json(data) -> Union[bytes, str]:
+    """Serialize archive metadata as indented JSON."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2)
+
+
+def _load_json(data: bytes):
+    """Parse archive metadata (raises json.JSONDecodeError on bad input)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def _get_profiles_dir() -> Path:
     """Get profiles directory from config."""
     return config.get_profiles_dir()
@@ -64,6 +93,23 @@ def export_profile_to_zip(profile_id: str, db: Session) -> bytes:
     Returns:
         ZIP file contents as bytes
         
+    Raises:
+        ValueError: If profile not found or has no samples
+    """
+    zip_buffer = io.BytesIO()
+    export_profile_to_zip_stream(profile_id, db, zip_buffer)
+    return zip_buffer.getvalue()
+
+
+def export_profile_to_zip_stream(profile_id: str, db: Session, out_stream: BinaryIO) -> None:
+    """
+    Export a voice profile as a ZIP archive written into a caller-provided stream.
+    
+    Args:
+        profile_id: Profile ID to export
+        db: Database session
+        out_stream: Writable, seekable binary stream to receive the archive
+        
     Raises:
         ValueError: If profile not found or has no samples
     """
@@ -77,10 +123,8 @@ def export_profile_to_zip(profile_id: str, db: Session) -> bytes:
     if not samples:
         raise ValueError(f"Profile {profile_id} has no samples")
     
-    # Create ZIP in memory
-    zip_buffer = io.BytesIO()
-    
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+    # Audio and images are stored as-is; only the JSON metadata is compressed
+    with zipfile.ZipFile(out_stream, 'w', zipfile.ZIP_STORED) as zip_file:
         # Check if profile has avatar
         has_avatar = False
         if profile.avatar_path:
@@ -101,7 +145,12 @@ def export_profile_to_zip(profile_id: str, db: Session) -> bytes:
             },
             "has_avatar": has_avatar,
         }
-        zip_file.writestr("manifest.json", json.dumps(manifest, indent=2))
+        zip_file.writestr(
+            "manifest.json",
+            _dump_json(manifest),
+            compress_type=zipfile.ZIP_DEFLATED,
+            compresslevel=1,
+        )
 
         # Create samples.json mapping
         samples_data = {}
@@ -123,10 +172,41 @@ def export_profile_to_zip(profile_id: str, db: Session) -> bytes:
             # Map filename to reference text
             samples_data[filename] = sample.reference_text
 
-        zip_file.writestr("samples.json", json.dumps(samples_data, indent=2))
+        zip_file.writestr(
+            "samples.json",
+            _dump_json(samples_data),
+            compress_type=zipfile.ZIP_DEFLATED,
+            compresslevel=1,
+        )
+
+
+def _extract_member(file_bytes: bytes, member: str, dest: Path) -> None:
+    """
+    Stream a single archive member to disk.
     
-    zip_buffer.seek(0)
-    return zip_buffer.read()
+    ZipFile objects are not safe to share between threads, so each call
+    opens its own handle over the (already in-memory) archive.
+    """
+    with zipfile.ZipFile(io.BytesIO(file_bytes), 'r') as zip_file:
+        with zip_file.open(member) as src, open(dest, "wb") as dst:
+            shutil.copyfileobj(src, dst, EXTRACT_CHUNK_SIZE)
+
+
+async def _extract_members(file_bytes: bytes, members: Dict[str, Path]) -> None:
+    """
+    Extract archive members to their destinations concurrently.
+    
+    Args:
+        file_bytes: ZIP file contents
+        members: Mapping of archive member name to destination path
+    """
+    semaphore = asyncio.Semaphore(EXTRACT_CONCURRENCY)
+    
+    async def extract(member: str, dest: Path) -> None:
+        async with semaphore:
+            await asyncio.to_thread(_extract_member, file_bytes, member, dest)
+    
+    await asyncio.gather(*(extract(member, dest) for member, dest in members.items()))
 
 
 async def import_profile_from_zip(file_bytes: bytes, db: Session) -> VoiceProfileResponse:
@@ -157,7 +237,7 @@ async def import_profile_from_zip(file_bytes: bytes, db: Session) -> VoiceProfil
                 raise ValueError("ZIP archive missing samples.json")
             
             # Read manifest
-            manifest_data = json.loads(zip_file.read("manifest.json"))
+            manifest_data = _load_json(zip_file.read("manifest.json"))
             
             if "version" not in manifest_data:
                 raise ValueError("Invalid manifest.json: missing version")
@@ -168,11 +248,22 @@ async def import_profile_from_zip(file_bytes: bytes, db: Session) -> VoiceProfil
             profile_data = manifest_data["profile"]
             
             # Read samples mapping
-            samples_data = json.loads(zip_file.read("samples.json"))
+            samples_data = _load_json(zip_file.read("samples.json"))
             
             if not isinstance(samples_data, dict):
                 raise ValueError("Invalid samples.json: must be a dictionary")
             
+            # Validate every sample before creating anything
+            names = set(namelist)
+            for filename in samples_data:
+                if not filename.endswith('.wav'):
+                    raise ValueError(f"Invalid sample filename: {filename} (must be .wav)")
+                
+                zip_path = f"samples/{filename}"
+                
+                if zip_path not in names:
+                    raise ValueError(f"Sample file not found in ZIP: {zip_path}")
+            
             # Get unique profile name
             original_name = profile_data.get("name", "Imported Profile")
             unique_name = _get_unique_profile_name(original_name, db)
@@ -196,7 +287,6 @@ async def import_profile_from_zip(file_bytes: bytes, db: Session) -> VoiceProfil
                 try:
                     avatar_file = avatar_files[0]
                     # Extract to temporary file
-                    import tempfile
                     with tempfile.NamedTemporaryFile(suffix=Path(avatar_file).suffix, delete=False) as tmp:
                         tmp.write(zip_file.read(avatar_file))
                         tmp_path = tmp.name
@@ -210,34 +300,32 @@ async def import_profile_from_zip(file_bytes: bytes, db: Session) -> VoiceProfil
                     # Avatar import is optional - continue even if it fails
                     pass
 
-            for filename, reference_text in samples_data.items():
-                # Validate filename
-                if not filename.endswith('.wav'):
-                    raise ValueError(f"Invalid sample filename: {filename} (must be .wav)")
-                
-                # Extract audio file to temp location
-                zip_path = f"samples/{filename}"
-                
-                if zip_path not in namelist:
-                    raise ValueError(f"Sample file not found in ZIP: {zip_path}")
-                
-                # Extract to temporary file
-                import tempfile
-                with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-                    tmp.write(zip_file.read(zip_path))
-                    tmp_path = tmp.name
+            # add_profile_sample validates and re-encodes from a path, so stream
+            # each sample into one scratch directory for the whole import
+            with tempfile.TemporaryDirectory() as extract_dir:
+                # Name scratch files by position: archive names may share a basename
+                sample_paths = {
+                    filename: Path(extract_dir) / f"{i}.wav"
+                    for i, filename in enumerate(samples_data)
+                }
+                await _extract_members(
+                    file_bytes,
+                    {f"samples/{filename}": path for filename, path in sample_paths.items()},
+                )
                 
-                try:
-                    # Add sample to profile
-                    await add_profile_sample(
-                        profile.id,
-                        tmp_path,
-                        reference_text,
-                        db,
-                    )
-                finally:
-                    # Clean up temp file
-                    Path(tmp_path).unlink(missing_ok=True)
+                # Database writes share one session, so samples are added in order
+                for filename, reference_text in samples_data.items():
+                    tmp_path = sample_paths[filename]
+                    try:
+                        # Add sample to profile
+                        await add_profile_sample(
+                            profile.id,
+                            str(tmp_path),
+                            reference_text,
+                            db,
+                        )
+                    finally:
+                        tmp_path.unlink(missing_ok=True)
             
             return profile
             
@@ -283,7 +371,8 @@ def export_generation_to_zip(generation_id: str, db: Session) -> bytes:
     # Create ZIP in memory
     zip_buffer = io.BytesIO()
     
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+    # Audio is stored as-is; only the JSON metadata is compressed
+    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_STORED) as zip_file:
         # Create manifest.json
         manifest = {
             "version": "1.0",
@@ -303,7 +392,12 @@ def export_generation_to_zip(generation_id: str, db: Session) -> bytes:
                 "language": profile.language,
             }
         }
-        zip_file.writestr("manifest.json", json.dumps(manifest, indent=2))
+        zip_file.writestr(
+            "manifest.json",
+            _dump_json(manifest),
+            compress_type=zipfile.ZIP_DEFLATED,
+            compresslevel=1,
+        )
         
         # Add audio file
         filename = audio_path.name
@@ -344,7 +438,7 @@ async def import_generation_from_zip(file_bytes: bytes, db: Session) -> dict:
                 raise ValueError("ZIP archive missing manifest.json")
             
             # Read manifest
-            manifest_data = json.loads(zip_file.read("manifest.json"))
+            manifest_data = _load_json(zip_file.read("manifest.json"))
             
             if "version" not in manifest_data:
                 raise ValueError("Invalid manifest.json: missing version")
@@ -9,12 +9,14 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 import asyncio
+import functools
 import uvicorn
 import argparse
 import tempfile
+import shutil
 import io
 from pathlib import Path
 import uuid
@@ -62,6 +64,24 @@ app.add_middleware(
 )
 
 
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+async def _save_upload_to_temp(file: UploadFile, suffix: str) -> str:
+    """
+    Stream an uploaded file to a named temp file without reading it into memory.
+
+    Returns:
+        Path to the temp file (the caller is responsible for deleting it)
+    """
+    def _copy() -> str:
+        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+            shutil.copyfileobj(file.file, tmp, UPLOAD_CHUNK_SIZE)
+            return tmp.name
+
+    return await asyncio.to_thread(_copy)
+
+
 # ============================================
 # ROOT & HEALTH ENDPOINTS
 # ============================================
@@ -173,21 +193,17 @@ async def health():
         )
 
     # Check for GPU availability (CUDA or MPS) - only if torch available
-    has_cuda = False
-    has_mps = False
+    has_cuda, has_mps, cuda_device_name = _get_torch_devices()
     vram_used = None
 
-    if HAS_TORCH and torch is not None:
-        has_cuda = torch.cuda.is_available()
-        has_mps = hasattr(torch.backends, 'mps') and torch.backends.mps.is_available()
-        if has_cuda:
-            vram_used = torch.cuda.memory_allocated() / 1024 / 1024  # MB
+    if has_cuda:
+        vram_used = torch.cuda.memory_allocated() / 1024 / 1024  # MB
 
     gpu_available = has_cuda or has_mps
 
     gpu_type = None
-    if has_cuda and torch is not None:
-        gpu_type = f"CUDA ({torch.cuda.get_device_name(0)})"
+    if has_cuda:
+        gpu_type = f"CUDA ({cuda_device_name})"
     elif has_mps:
         gpu_type = "MPS (Apple Silicon)"
     elif backend_type == "mlx":
@@ -345,10 +361,7 @@ async def add_profile_sample(
 ):
     """Add a sample to a voice profile."""
     # Save uploaded file to temporary location
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = tmp.name
+    tmp_path = await _save_upload_to_temp(file, ".wav")
     
     try:
         sample = await profiles.add_profile_sample(
@@ -407,10 +420,7 @@ async def upload_profile_avatar(
 ):
     """Upload or update avatar image for a profile."""
     # Save uploaded file to temp location
-    with tempfile.NamedTemporaryFile(delete=False, suffix=Path(file.filename).suffix) as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = tmp.name
+    tmp_path = await _save_upload_to_temp(file, Path(file.filename).suffix)
 
     try:
         profile = await profiles.upload_avatar(profile_id, tmp_path, db)
@@ -454,6 +464,22 @@ async def delete_profile_avatar(
     return {"message": "Avatar deleted successfully"}
 
 
+EXPORT_SPOOL_MAX_SIZE = 8 * 1024 * 1024  # Keep small exports in memory
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+
+def _iter_file_chunks(file_obj, chunk_size: int = EXPORT_CHUNK_SIZE):
+    """Yield a file's contents in fixed-size blocks, closing it when done."""
+    try:
+        while True:
+            chunk = file_obj.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        file_obj.close()
+
+
 @app.get("/profiles/{profile_id}/export")
 async def export_profile(
     profile_id: str,
@@ -466,8 +492,14 @@ async def export_profile(
         if not profile:
             raise HTTPException(status_code=404, detail="Profile not found")
         
-        # Export to ZIP
-        zip_bytes = export_import.export_profile_to_zip(profile_id, db)
+        # Export to ZIP, spilling to disk for large profiles
+        zip_file = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_SIZE)
+        try:
+            export_import.export_profile_to_zip_stream(profile_id, db, zip_file)
+        except Exception:
+            zip_file.close()
+            raise
+        zip_file.seek(0)
         
         # Create safe filename
         safe_name = "".join(c for c in profile.name if c.isalnum() or c in (' ', '-', '_')).strip()
@@ -477,7 +509,7 @@ async def export_profile(
         
         # Return as streaming response
         return StreamingResponse(
-            io.BytesIO(zip_bytes),
+            _iter_file_chunks(zip_file),
             media_type="application/zip",
             headers={
                 "Content-Disposition": f'attachment; filename="{filename}"'
@@ -897,10 +929,7 @@ async def transcribe_audio(
 ):
     """Transcribe audio file to text."""
     # Save uploaded file to temporary location
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = tmp.name
+    tmp_path = await _save_upload_to_temp(file, ".wav")
     
     try:
         # Get audio duration
@@ -1755,16 +1784,32 @@ async def get_active_tasks():
 # STARTUP & SHUTDOWN
 # ============================================
 
+@functools.lru_cache(maxsize=1)
+def _get_torch_devices() -> Tuple[bool, bool, Optional[str]]:
+    """
+    Probe torch GPU support once per process.
+
+    Returns:
+        Tuple of (has_cuda, has_mps, cuda_device_name)
+    """
+    if not HAS_TORCH or torch is None:
+        return False, False, None
+    has_cuda = torch.cuda.is_available()
+    has_mps = hasattr(torch.backends, 'mps') and torch.backends.mps.is_available()
+    cuda_device_name = torch.cuda.get_device_name(0) if has_cuda else None
+    return has_cuda, has_mps, cuda_device_name
+
+
 def _get_gpu_status() -> str:
     """Get GPU availability status."""
     backend_type = get_backend_type()
     if backend_type == "replicate":
         return "Replicate Cloud GPU"
-    if HAS_TORCH and torch is not None:
-        if torch.cuda.is_available():
-            return f"CUDA ({torch.cuda.get_device_name(0)})"
-        elif hasattr(torch.backends, 'mps') and torch.backends.mps.is_available():
-            return "MPS (Apple Silicon)"
+    has_cuda, has_mps, cuda_device_name = _get_torch_devices()
+    if has_cuda:
+        return f"CUDA ({cuda_device_name})"
+    elif has_mps:
+        return "MPS (Apple Silicon)"
     if backend_type == "mlx":
         return "Metal (Apple Silicon via MLX)"
     return "None (CPU only)"
@@ -1780,6 +1825,15 @@ async def startup_event():
     print(f"Backend: {backend_type.upper()}")
     print(f"GPU available: {_get_gpu_status()}")
 
+    # Establish the Replicate API connection in the background
+    if backend_type == "replicate":
+        try:
+            from .backends.replicate_backend import warm_up_connections
+        except ImportError:
+            from backends.replicate_backend import warm_up_connections
+        # Keep a reference: the event loop only holds tasks weakly
+        app.state.warmup_task = asyncio.create_task(warm_up_connections())
+
     # Initialize progress manager with main event loop for thread-safe operations
     try:
         progress_manager = get_progress_manager()
@@ -1807,6 +1861,14 @@ async def shutdown_event():
     tts.unload_tts_model()
     transcribe.unload_whisper_model()
 
+    # Close pooled connections used to download Replicate outputs
+    if get_backend_type() == "replicate":
+        try:
+            from .backends.replicate_backend import close_http_client
+        except ImportError:
+            from backends.replicate_backend import close_http_client
+        await close_http_client()
+
 
 # ============================================
 # MAIN
@@ -2,11 +2,13 @@
 Platform detection for backend selection.
 """
 
+import functools
 import os
 import platform
 from typing import Literal
 
 
+@functools.lru_cache(maxsize=1)
 def is_apple_silicon() -> bool:
     """
     Check if running on Apple Silicon (arm64 macOS).
@@ -17,10 +19,14 @@ def is_apple_silicon() -> bool:
     return platform.system() == "Darwin" and platform.machine() == "arm64"
 
 
+@functools.lru_cache(maxsize=1)
 def get_backend_type() -> Literal["mlx", "pytorch", "replicate"]:
     """
     Detect the best backend for the current platform.
 
+    The result is cached for the life of the process; call
+    get_backend_type.cache_clear() after changing the environment.
+
     Priority:
     1. TTS_BACKEND env var if set
     2. REPLICATE_API_TOKEN/KEY present → use Replicate
@@ -4,12 +4,19 @@ Voice profile management module.
 
 from typing import List, Optional
 from datetime import datetime
+import base64
 import uuid
 import shutil
 from pathlib import Path
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 
+# pybase64 is a drop-in for the stdlib codec backed by SIMD kernels
+try:
+    import pybase64
+except ImportError:
+    pybase64 = base64
+
 # Support both package imports (local dev) and direct imports (cloud deployment)
 try:
     from .models import (
@@ -124,9 +131,8 @@ async def add_profile_sample(
     save_audio(audio, str(dest_path), sr)
 
     # Also store audio as base64 for cloud deployments with ephemeral filesystems
-    import base64
     with open(str(dest_path), "rb") as f:
-        audio_base64 = base64.b64encode(f.read()).decode("utf-8")
+        audio_base64 = pybase64.b64encode(f.read()).decode("ascii")
 
     # Create database entry
     db_sample = DBProfileSample(
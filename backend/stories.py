@@ -5,7 +5,6 @@ Story management module.
 from typing import List, Optional
 from datetime import datetime
 import uuid
-import tempfile
 from pathlib import Path
 from sqlalchemy.orm import Session
 from sqlalchemy import func
@@ -24,7 +23,7 @@ try:
         StoryItemSplit,
     )
     from .database import Story as DBStory, StoryItem as DBStoryItem, Generation as DBGeneration, VoiceProfile as DBVoiceProfile
-    from .utils.audio import load_audio, save_audio
+    from .utils.audio import load_audio, encode_wav
 except ImportError:
     from models import (
         StoryCreate,
@@ -38,7 +37,7 @@ except ImportError:
         StoryItemSplit,
     )
     from database import Story as DBStory, StoryItem as DBStoryItem, Generation as DBGeneration, VoiceProfile as DBVoiceProfile
-    from utils.audio import load_audio, save_audio
+    from utils.audio import load_audio, encode_wav
 import numpy as np
 
 
@@ -966,23 +965,10 @@ async def export_story_audio(
             # Normalize to prevent clipping (simple approach: divide by max)
             final_audio[start_sample:end_sample] += audio_to_mix
 
-    # Normalize to prevent clipping
+    # Normalize to prevent clipping (in place, stays float32)
     max_val = np.abs(final_audio).max()
     if max_val > 1.0:
-        final_audio = final_audio / max_val
+        final_audio /= max_val
 
-    # Save to temporary file
-    with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp:
-        tmp_path = tmp.name
-
-    try:
-        save_audio(final_audio, tmp_path, sample_rate)
-
-        # Read file bytes
-        with open(tmp_path, 'rb') as f:
-            audio_bytes = f.read()
-
-        return audio_bytes
-    finally:
-        # Clean up temp file
-        Path(tmp_path).unlink(missing_ok=True)
+    # Encode WAV in memory instead of round-tripping through a temp file
+    return encode_wav(final_audio, sample_rate)
@@ -2,6 +2,7 @@
 Audio processing utilities.
 """
 
+import io
 import numpy as np
 import soundfile as sf
 import librosa
@@ -24,22 +25,41 @@ def normalize_audio(
     Returns:
         Normalized audio array
     """
-    # Convert to float32
+    # Convert to float32 (always a copy, so the input is left untouched)
     audio = audio.astype(np.float32)
     
-    # Calculate current RMS
-    rms = np.sqrt(np.mean(audio**2))
+    return normalize_audio_inplace(audio, target_db, peak_limit)
+
+
+def normalize_audio_inplace(
+    audio: np.ndarray,
+    target_db: float = -20.0,
+    peak_limit: float = 0.85,
+) -> np.ndarray:
+    """
+    Normalize a float32 audio array in place (see normalize_audio).
+    
+    Args:
+        audio: Float32 audio array, modified in place
+        target_db: Target RMS level in dB
+        peak_limit: Peak limit (0.0-1.0)
+        
+    Returns:
+        The same array, normalized
+    """
+    # Calculate current RMS without materializing audio**2
+    flat = audio.reshape(-1)
+    rms = np.sqrt(np.dot(flat, flat) / flat.size) if flat.size else 0.0
     
     # Calculate target RMS
     target_rms = 10**(target_db / 20)
     
     # Apply gain
     if rms > 0:
-        gain = target_rms / rms
-        audio = audio * gain
+        audio *= np.float32(target_rms / rms)
     
     # Peak limiting
-    audio = np.clip(audio, -peak_limit, peak_limit)
+    np.clip(audio, -peak_limit, peak_limit, out=audio)
     
     return audio
 
@@ -80,6 +100,25 @@ def save_audio(
     sf.write(path, audio, sample_rate)
 
 
+def encode_wav(
+    audio: np.ndarray,
+    sample_rate: int = 24000,
+) -> bytes:
+    """
+    Encode audio as WAV bytes in memory (16-bit PCM, like save_audio).
+    
+    Args:
+        audio: Audio array
+        sample_rate: Sample rate
+        
+    Returns:
+        WAV file contents
+    """
+    buffer = io.BytesIO()
+    sf.write(buffer, audio, sample_rate, format="WAV", subtype="PCM_16")
+    return buffer.getvalue()
+
+
 def validate_reference_audio(
     audio_path: str,
     min_duration: float = 2.0,
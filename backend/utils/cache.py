@@ -3,6 +3,8 @@ Voice prompt caching utilities.
 """
 
 import hashlib
+import mmap
+import os
 from pathlib import Path
 from typing import Optional, Union, Dict, Any, TYPE_CHECKING
 
@@ -41,15 +43,18 @@ def get_cache_key(audio_path: str, reference_text: str) -> str:
     Returns:
         Cache key (MD5 hash)
     """
-    # Read audio file
+    hasher = hashlib.md5()
+
+    # Hash the audio straight from a memory map (no read or concatenation
+    # copies); the digest is identical to hashing audio bytes + text
     with open(audio_path, "rb") as f:
-        audio_bytes = f.read()
+        if os.fstat(f.fileno()).st_size > 0:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                hasher.update(mm)
 
-    # Combine audio bytes and text
-    combined = audio_bytes + reference_text.encode("utf-8")
+    hasher.update(reference_text.encode("utf-8"))
 
-    # Generate hash
-    return hashlib.md5(combined).hexdigest()
+    return hasher.hexdigest()
 
 
 def get_cached_voice_prompt(
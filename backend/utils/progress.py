@@ -9,6 +9,21 @@ import json
 import threading
 from datetime import datetime
 
+# orjson is optional - falls back to the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _sse_event(data: Dict) -> str:
+    """Format a progress dict as a Server-Sent Events data frame."""
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY).decode("utf-8")
+    else:
+        payload = json.dumps(data)
+    return f"data: {payload}\n\n"
+
 
 class ProgressManager:
     """Manages download progress for multiple models.
@@ -224,7 +239,7 @@ class ProgressManager:
                 # Don't send old 'complete' or 'error' status from previous downloads
                 if status in ('downloading', 'extracting'):
                     logger.info(f"Sending initial progress for {model_name}: {status}")
-                    yield f"data: {json.dumps(initial_progress)}\n\n"
+                    yield _sse_event(initial_progress)
                 else:
                     logger.info(f"Skipping initial progress for {model_name} (status: {status})")
             else:
@@ -236,7 +251,7 @@ class ProgressManager:
                     # Wait for update with timeout
                     progress = await asyncio.wait_for(queue.get(), timeout=1.0)
                     logger.debug(f"Sending progress update for {model_name}: {progress.get('status')} - {progress.get('progress', 0):.1f}%")
-                    yield f"data: {json.dumps(progress)}\n\n"
+                    yield _sse_event(progress)
 
                     # Stop if complete or error
                     if progress.get("status") in ("complete", "error"):